@@ -16,14 +16,43 @@ from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+from loguru import logger
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment] # Optional dependency
 
 from guidellm.backends.backend import Backend
-from guidellm.backends.response_handlers import GenerationResponseHandlerFactory
-from guidellm.schemas import GenerationRequest, GenerationResponse, RequestInfo
+from guidellm.backends.response_handlers import (
+    GenerationResponseHandler,
+    GenerationResponseHandlerFactory,
+)
+from guidellm.schemas import (
+    GenerationRequest,
+    GenerationResponse,
+    RequestInfo,
+    RequestTimings,
+)
+from guidellm.utils import json
 
 __all__ = ["OpenAIHTTPBackend"]
 
 
+# HTTP clients shared by backends with identical client configuration, grouped by
+# the event loop they run on and mapped to their active reference count. A used
+# client's connections reference its loop, so entries left behind by backends that
+# were never shut down are pruned on the next startup once their loop has closed.
+# No lock is needed: each loop runs on a single thread and the registry is only
+# touched without awaiting, so updates for one loop can never interleave.
+_SHARED_CLIENTS: dict[
+    asyncio.AbstractEventLoop, dict[tuple[Any, ...], tuple[httpx.AsyncClient, int]]
+] = {}
+
+# Set once the default event loop warning has been emitted for this process
+_UVLOOP_WARNED = False
+
+
 @Backend.register("openai_http")
 class OpenAIHTTPBackend(Backend):
     """
@@ -34,6 +63,17 @@ class OpenAIHTTPBackend(Backend):
     Handles request formatting, response parsing, error handling, and token
     usage tracking with flexible parameter customization.
 
+    Streaming responses are read as they arrive from the network by default. Setting
+    stream_chunk_size makes httpx coalesce the body into fixed-size chunks, trading
+    fewer event loop wake-ups for fast servers against delayed delivery of tokens,
+    which inflates the measured time to first token and inter-token latencies.
+
+    Running on a uvloop event loop is recommended, as it cuts the per-callback and
+    socket overhead on every await of the streaming hot path. GuideLLM's CLI and
+    scheduler workers install it whenever uvloop is importable; since the loop
+    policy must be set before the loop is created, the backend only warns when it
+    finds itself on the default asyncio loop with uvloop installed.
+
     Example:
     ::
         backend = OpenAIHTTPBackend(
@@ -58,6 +98,11 @@ class OpenAIHTTPBackend(Backend):
         http2: bool = True,
         follow_redirects: bool = True,
         verify: bool = False,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = 5.0,
+        handler_pool_size: int = 256,
+        stream_chunk_size: int | None = None,
         validate_backend: bool | str | dict[str, Any] = True,
     ):
         """
@@ -65,12 +110,24 @@ class OpenAIHTTPBackend(Backend):
 
         :param target: Base URL of the OpenAI-compatible server
         :param model: Model identifier for generation requests
-        :param api_routes: Custom API endpoint routes mapping
+        :param api_routes: Custom API endpoint routes mapping; generation request
+            URLs are built from these routes and the target at construction, so
+            later changes to either attribute are not picked up by resolve
         :param response_handlers: Custom response handlers for different request types
         :param timeout: Request timeout in seconds
         :param http2: Enable HTTP/2 protocol support
         :param follow_redirects: Follow HTTP redirects automatically
         :param verify: Enable SSL certificate verification
+        :param max_connections: Maximum number of concurrent connections in the
+            HTTP client pool, or None for unlimited
+        :param max_keepalive_connections: Maximum number of idle keep-alive
+            connections retained for reuse, or None for unlimited
+        :param keepalive_expiry: Seconds an idle keep-alive connection is retained
+            before being closed, or None to keep them open indefinitely
+        :param handler_pool_size: Maximum number of idle response handlers kept per
+            request type for reuse across requests
+        :param stream_chunk_size: Number of bytes to accumulate before processing a
+            streamed chunk, or None to process data as soon as it is received
         :param validate_backend: Backend validation configuration
         """
         super().__init__(type_="openai_http")
@@ -93,13 +150,29 @@ class OpenAIHTTPBackend(Backend):
         self.http2 = http2
         self.follow_redirects = follow_redirects
         self.verify = verify
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.handler_pool_size = handler_pool_size
+        self.stream_chunk_size = stream_chunk_size
         self.validate_backend: dict[str, Any] | None = self._resolve_validate_kwargs(
             validate_backend
         )
 
+        # Resolve generation request URLs once rather than on every request
+        self._url_by_type: dict[str, str] = {
+            request_type: f"{self.target}/{route}"
+            for request_type, route in self.api_routes.items()
+            if request_type not in ("health", "models")
+        }
+        self._supported_types = tuple(self._url_by_type)
+
         # Runtime state
         self._in_process = False
         self._async_client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._client_key: tuple[Any, ...] | None = None
+        self._handler_pool: dict[str, list[GenerationResponseHandler]] = {}
 
     @property
     def info(self) -> dict[str, Any]:
@@ -115,6 +188,11 @@ class OpenAIHTTPBackend(Backend):
             "http2": self.http2,
             "follow_redirects": self.follow_redirects,
             "verify": self.verify,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "handler_pool_size": self.handler_pool_size,
+            "stream_chunk_size": self.stream_chunk_size,
             "openai_paths": self.api_routes,
             "validate_backend": self.validate_backend,
         }
@@ -123,38 +201,96 @@ class OpenAIHTTPBackend(Backend):
         """
         Initialize HTTP client and backend resources.
 
+        Backends with identical client configuration running on the same event loop
+        share a single HTTP client and its connection pool.
+
         :raises RuntimeError: If backend is already initialized
         :raises httpx.RequestError: If HTTP client cannot be created
         """
+        global _UVLOOP_WARNED  # noqa: PLW0603
+
         if self._in_process:
             raise RuntimeError("Backend already started up for process.")
 
-        self._async_client = httpx.AsyncClient(
-            http2=self.http2,
-            timeout=self.timeout,
-            follow_redirects=self.follow_redirects,
-            verify=self.verify,
-            # Allow unlimited connections
-            limits=httpx.Limits(
-                max_connections=None,
-                max_keepalive_connections=None,
-                keepalive_expiry=5.0,  # default
-            ),
+        if (
+            uvloop is not None
+            and not _UVLOOP_WARNED
+            and not isinstance(asyncio.get_running_loop(), uvloop.Loop)
+        ):
+            _UVLOOP_WARNED = True
+            logger.warning(
+                "OpenAIHTTPBackend is running on the default asyncio event loop; "
+                "set uvloop's event loop policy before creating the loop for "
+                "higher request throughput."
+            )
+
+        # Connections are bound to the event loop that opened them, so clients are
+        # only shared between backends running on the same loop
+        self._client_loop = asyncio.get_running_loop()
+
+        for loop in [loop for loop in _SHARED_CLIENTS if loop.is_closed()]:
+            del _SHARED_CLIENTS[loop]
+
+        self._client_key = (
+            self.http2,
+            self.timeout,
+            self.follow_redirects,
+            self.verify,
+            self.max_connections,
+            self.max_keepalive_connections,
+            self.keepalive_expiry,
         )
+        loop_clients = _SHARED_CLIENTS.setdefault(self._client_loop, {})
+        client, references = loop_clients.get(self._client_key, (None, 0))
+
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self.timeout,
+                follow_redirects=self.follow_redirects,
+                verify=self.verify,
+                # Unlimited connections by default so requests never queue
+                # client-side for a pool slot
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+
+        loop_clients[self._client_key] = (client, references + 1)
+
+        self._async_client = client
         self._in_process = True
 
     async def process_shutdown(self):
         """
         Clean up HTTP client and backend resources.
 
+        The HTTP client is only closed once no other backend on the same event loop
+        is still using it.
+
         :raises RuntimeError: If backend was not properly initialized
         :raises httpx.RequestError: If HTTP client cannot be closed
         """
         if not self._in_process:
             raise RuntimeError("Backend not started up for process.")
 
-        await self._async_client.aclose()  # type: ignore [union-attr]
+        loop_clients = _SHARED_CLIENTS.get(self._client_loop, {})
+        client, references = loop_clients.pop(self._client_key, (self._async_client, 1))
+
+        if references > 1:
+            loop_clients[self._client_key] = (client, references - 1)
+        elif not loop_clients:
+            _SHARED_CLIENTS.pop(self._client_loop, None)
+
+        if references <= 1:
+            await client.aclose()  # type: ignore [union-attr]
+
         self._async_client = None
+        self._client_loop = None
+        self._client_key = None
+        self._handler_pool.clear()
         self._in_process = False
 
     async def validate(self):
@@ -217,7 +353,9 @@ class OpenAIHTTPBackend(Backend):
         Process generation request and yield progressive responses.
 
         Handles request formatting, timing tracking, API communication, and
-        response parsing with streaming support.
+        response parsing with streaming support. Timings are measured on the
+        monotonic clock and reported as Unix timestamps via a wall-clock offset
+        captured once per request, so deltas are immune to system clock changes.
 
         :param request: Generation request with content and parameters
         :param request_info: Request tracking info updated with timing metadata
@@ -233,82 +371,247 @@ class OpenAIHTTPBackend(Backend):
         if history is not None:
             raise NotImplementedError("Multi-turn requests not yet supported")
 
-        if (request_path := self.api_routes.get(request.request_type)) is None:
-            raise ValueError(f"Unsupported request type '{request.request_type}'")
+        if (request_url := self._url_by_type.get(request.request_type)) is None:
+            raise ValueError(
+                f"Unsupported request type '{request.request_type}'. "
+                f"Supported: {self._supported_types}"
+            )
 
-        request_url = f"{self.target}/{request_path}"
-        request_files = (
-            {
-                key: tuple(value) if isinstance(value, list) else value
-                for key, value in request.arguments.files.items()
-            }
-            if request.arguments.files
-            else None
-        )
-        request_json = request.arguments.body if not request_files else None
-        request_data = request.arguments.body if request_files else None
-        response_handler = GenerationResponseHandlerFactory.create(
-            request.request_type, handler_overrides=self.response_handlers
-        )
+        request_kwargs = self._resolve_request_kwargs(request)
+        response_handler = self._acquire_response_handler(request.request_type)
 
-        if not request.arguments.stream:
-            request_info.timings.request_start = time.time()
-            response = await self._async_client.request(
-                request.arguments.method or "POST",
-                request_url,
-                params=request.arguments.params,
-                headers=request.arguments.headers,
-                json=request_json,
-                data=request_data,
-                files=request_files,
-            )
-            request_info.timings.request_end = time.time()
-            response.raise_for_status()
-            data = response.json()
-            yield response_handler.compile_non_streaming(request, data), request_info
-            return
+        # Timings are recorded on the monotonic clock, offset once to Unix time so
+        # they stay comparable with the scheduler's timestamps. loop.time() is not
+        # used since uvloop backs it with a millisecond resolution clock.
+        timings = request_info.timings
+        monotonic = time.monotonic
+        clock_offset = time.time() - monotonic()
 
         try:
-            request_info.timings.request_start = time.time()
-
-            async with self._async_client.stream(
-                request.arguments.method or "POST",
-                request_url,
-                params=request.arguments.params,
-                headers=request.arguments.headers,
-                json=request_json,
-                data=request_data,
-                files=request_files,
-            ) as stream:
-                stream.raise_for_status()
-                end_reached = False
-
-                async for chunk in stream.aiter_lines():
-                    iter_time = time.time()
-
-                    if request_info.timings.first_request_iteration is None:
-                        request_info.timings.first_request_iteration = iter_time
-                    request_info.timings.last_request_iteration = iter_time
-                    request_info.timings.request_iterations += 1
-
-                    iterations = response_handler.add_streaming_line(chunk)
+            if not request.arguments.stream:
+                timings.request_start = monotonic() + clock_offset
+                try:
+                    response = await self._async_client.request(
+                        request.arguments.method or "POST",
+                        request_url,
+                        **request_kwargs,
+                    )
+                finally:
+                    timings.request_end = monotonic() + clock_offset
+
+                response.raise_for_status()
+                # Parse straight from bytes rather than via response.text
+                data = json.loads(response.content)
+                yield (
+                    response_handler.compile_non_streaming(request, data),
+                    request_info,
+                )
+                return
+
+            try:
+                timings.request_start = monotonic() + clock_offset
+                try:
+                    async with self._async_client.stream(
+                        request.arguments.method or "POST",
+                        request_url,
+                        **request_kwargs,
+                    ) as stream:
+                        stream.raise_for_status()
+                        await self._consume_stream(
+                            stream, response_handler, timings, clock_offset
+                        )
+                finally:
+                    # Set on every exit path, before any partial result is yielded
+                    timings.request_end = monotonic() + clock_offset
+
+                yield response_handler.compile_streaming(request), request_info
+            except asyncio.CancelledError:
+                # Yield current result to store iterative results before propagating
+                yield response_handler.compile_streaming(request), request_info
+                raise
+        finally:
+            self._release_response_handler(request.request_type, response_handler)
+
+    async def _consume_stream(
+        self,
+        stream: httpx.Response,
+        response_handler: GenerationResponseHandler,
+        timings: RequestTimings,
+        clock_offset: float,
+    ):
+        """
+        Feed streamed lines to the response handler and track iteration timings.
+
+        Per-line counters and last iteration times are kept in locals and written
+        to the timings model once the stream ends, errors, or is cancelled, rather
+        than through a pydantic attribute assignment on every line. The first
+        request and token iteration times are recorded as soon as they occur.
+
+        :param stream: Open streaming response to read from
+        :param response_handler: Handler accumulating the streamed content
+        :param timings: Request timings to update with iteration metadata
+        :param clock_offset: Offset converting monotonic times to Unix timestamps
+        """
+        monotonic = time.monotonic
+        end_reached = False
+        first_request_iteration = timings.first_request_iteration
+        first_token_iteration = timings.first_token_iteration
+        last_request_iteration = timings.last_request_iteration
+        last_token_iteration = timings.last_token_iteration
+        request_iterations = timings.request_iterations
+        token_iterations = timings.token_iterations
+
+        try:
+            async for lines in self._aiter_stream_line_batches(stream):
+                # Lines received together share the arrival time of their chunk
+                iter_time = monotonic() + clock_offset
+
+                if first_request_iteration is None:
+                    first_request_iteration = iter_time
+                    timings.first_request_iteration = iter_time
+
+                for line in lines:
+                    last_request_iteration = iter_time
+                    request_iterations += 1
+
+                    iterations = response_handler.add_streaming_line(line)
                     if iterations is None or iterations <= 0 or end_reached:
                         end_reached = end_reached or iterations is None
                         continue
 
-                    if request_info.timings.first_token_iteration is None:
-                        request_info.timings.first_token_iteration = iter_time
-                        request_info.timings.token_iterations = 0
+                    if first_token_iteration is None:
+                        first_token_iteration = iter_time
+                        timings.first_token_iteration = iter_time
+                        token_iterations = 0
 
-                    request_info.timings.last_token_iteration = iter_time
-                    request_info.timings.token_iterations += iterations
+                    last_token_iteration = iter_time
+                    token_iterations += iterations
+        finally:
+            timings.last_request_iteration = last_request_iteration
+            timings.last_token_iteration = last_token_iteration
+            timings.request_iterations = request_iterations
+            timings.token_iterations = token_iterations
 
-            request_info.timings.request_end = time.time()
-            yield response_handler.compile_streaming(request), request_info
-        except asyncio.CancelledError as err:
-            # Yield current result to store iterative results before propagating
-            yield response_handler.compile_streaming(request), request_info
-            raise err
+    def _acquire_response_handler(self, request_type: str) -> GenerationResponseHandler:
+        """
+        Get a response handler for the request type, reusing a pooled one if any.
+
+        :param request_type: The type of generation request being resolved
+        :return: A response handler with no accumulated state
+        """
+        if pool := self._handler_pool.get(request_type):
+            return pool.pop()
+
+        return GenerationResponseHandlerFactory.create(
+            request_type, handler_overrides=self.response_handlers
+        )
+
+    def _release_response_handler(
+        self, request_type: str, handler: GenerationResponseHandler
+    ):
+        """
+        Reset a response handler and return it to the pool for later requests.
+
+        Only handlers built from the registry are reused, since their reset method is
+        known to clear all of their state; handlers from response_handlers overrides,
+        which may carry state an inherited reset does not know about, and handlers
+        beyond the pool size cap are dropped.
+
+        :param request_type: The type of generation request the handler served
+        :param handler: The response handler to release
+        """
+        if self.response_handlers and request_type in self.response_handlers:
+            return
+
+        pool = self._handler_pool.setdefault(request_type, [])
+
+        if len(pool) < self.handler_pool_size and (
+            reset := getattr(handler, "reset", None)
+        ):
+            reset()
+            pool.append(handler)
+
+    async def _aiter_stream_line_batches(
+        self, stream: httpx.Response
+    ) -> AsyncIterator[list[bytes]]:
+        """
+        Split a streaming response body into lines at the byte level.
+
+        Avoids httpx's incremental text decoder and line scanner by buffering the
+        raw body bytes; lines are handed to the response handlers undecoded so the
+        JSON payloads go straight from bytes to the parser. All complete lines in a
+        received chunk are yielded together, so the consumer resumes once per
+        network read rather than once per line.
+
+        Lines may be terminated by LF, CRLF, or a lone CR, matching both the SSE
+        specification and httpx's line decoder; chunks containing a CR are
+        normalized to LF before splitting so LF-only streams keep the fast path.
+
+        :param stream: Open streaming response to read from
+        :yields: Batches of raw lines without trailing line terminators
+        """
+        buffer = bytearray()
+        pending_cr = False
+
+        async for chunk in stream.aiter_bytes(chunk_size=self.stream_chunk_size):
+            buffer.extend(chunk)
+
+            if pending_cr and buffer.startswith(b"\n"):
+                # Second half of a CRLF split across chunks, already terminated
+                del buffer[:1]
+            pending_cr = chunk.endswith(b"\r")
+
+            if b"\r" in chunk:
+                buffer = buffer.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+            if (index := buffer.rfind(b"\n")) == -1:
+                continue
+
+            data = bytes(buffer[:index])
+            del buffer[: index + 1]
+            yield data.split(b"\n")
+
+        if buffer:
+            yield [bytes(buffer)]
+
+    def _resolve_request_kwargs(self, request: GenerationRequest) -> dict[str, Any]:
+        """
+        Build the httpx request arguments for a generation request.
+
+        JSON bodies are serialized once here (with orjson when available) and sent
+        as raw content, rather than letting httpx re-encode them with the stdlib
+        json module. Requests with file uploads send the body as form data instead.
+
+        :param request: Generation request with content and parameters
+        :return: Keyword arguments for the httpx request or stream call
+        """
+        headers = request.arguments.headers
+        body = request.arguments.body
+
+        if request.arguments.files:
+            return {
+                "params": request.arguments.params,
+                "headers": headers,
+                "content": None,
+                "data": body,
+                "files": {
+                    key: tuple(value) if isinstance(value, list) else value
+                    for key, value in request.arguments.files.items()
+                },
+            }
+
+        if body is not None and not any(
+            key.lower() == "content-type" for key in headers or {}
+        ):
+            headers = {**(headers or {}), "content-type": "application/json"}
+
+        return {
+            "params": request.arguments.params,
+            "headers": headers,
+            "content": json.dumps(body) if body is not None else None,
+            "data": None,
+            "files": None,
+        }
 
     def _resolve_validate_kwargs(
         self, validate_backend: bool | str | dict[str, Any]
@@ -23,6 +23,10 @@ __all__ = [
 ]
 
 
+_END_OF_STREAM_LINE = b"data: [DONE]"
+"""Server-sent event line marking the end of a streamed response, as raw bytes"""
+
+
 class GenerationResponseHandler(Protocol):
     """
     Protocol for handling generation API responses.
@@ -44,10 +48,13 @@ class GenerationResponseHandler(Protocol):
         """
         ...
 
-    def add_streaming_line(self, line: str) -> int | None:
+    def add_streaming_line(self, line: str | bytes) -> int | None:
         """
         Process a single line from a streaming response.
 
+        Implementations must accept both ``bytes`` and ``str`` lines; backends pass
+        undecoded bytes so JSON payloads can be parsed without a UTF-8 decode.
+
         :param line: Raw line from the streaming response
         :return: 1 if content was updated, 0 if line was ignored, None if done
         """
@@ -126,6 +133,14 @@ class TextCompletionsResponseHandler(GenerationResponseHandler):
         self.streaming_usage: dict[str, int | dict[str, int]] | None = None
         self.streaming_response_id: str | None = None
 
+    def reset(self):
+        """
+        Clear accumulated streaming state so the handler can serve a new request.
+        """
+        self.streaming_texts.clear()
+        self.streaming_usage = None
+        self.streaming_response_id = None
+
     def compile_non_streaming(
         self, request: GenerationRequest, response: dict
     ) -> GenerationResponse:
@@ -143,16 +158,14 @@ class TextCompletionsResponseHandler(GenerationResponseHandler):
 
         return GenerationResponse(
             request_id=request.request_id,
-            request_args=str(
-                request.arguments.model_dump() if request.arguments else None
-            ),
+            request_args=None,
             response_id=response.get("id"),  # use vLLM ID if available
             text=text,
             input_metrics=input_metrics,
             output_metrics=output_metrics,
         )
 
-    def add_streaming_line(self, line: str) -> int | None:
+    def add_streaming_line(self, line: str | bytes) -> int | None:
         """
         Process a single line from a text completion streaming response.
 
@@ -193,31 +206,44 @@ class TextCompletionsResponseHandler(GenerationResponseHandler):
 
         return GenerationResponse(
             request_id=request.request_id,
-            request_args=str(
-                request.arguments.model_dump() if request.arguments else None
-            ),
+            request_args=None,
             response_id=self.streaming_response_id,  # use vLLM ID if available
             text=text,
             input_metrics=input_metrics,
             output_metrics=output_metrics,
         )
 
-    def extract_line_data(self, line: str) -> dict[str, Any] | None:
+    def extract_line_data(self, line: str | bytes) -> dict[str, Any] | None:
         """
         Extract JSON data from a streaming response line.
 
-        :param line: Raw line from the streaming response
+        :param line: Raw line from the streaming response, as bytes or str
         :return: Parsed JSON data as dictionary, or None if line indicates completion
         """
-        if line == "data: [DONE]":
+        if isinstance(line, str):
+            line = line.encode("utf-8")
+
+        if line == _END_OF_STREAM_LINE:
             return None
 
-        if not line or not (line := line.strip()) or not line.startswith("data:"):
-            return {}
+        if not line.startswith(b"data:"):
+            # Slow path for padded lines; well-formed SSE lines skip the strip
+            if not (line := line.strip()).startswith(b"data:"):
+                return {}
 
-        line = line[len("data:") :].strip()
+            if line == _END_OF_STREAM_LINE:
+                return None
 
-        return json.loads(line)
+        # The JSON parsers ignore whitespace around the payload, so no strip needed
+        payload = line[len(b"data:") :]
+
+        try:
+            return json.loads(payload)
+        except json.JSONDecodeError:
+            # Padded end of stream markers are only checked for once parsing fails
+            if payload.strip() == b"[DONE]":
+                return None
+            raise
 
     def extract_choices_and_usage(
         self, response: dict
@@ -309,16 +335,14 @@ class ChatCompletionsResponseHandler(TextCompletionsResponseHandler):
 
         return GenerationResponse(
             request_id=request.request_id,
-            request_args=str(
-                request.arguments.model_dump() if request.arguments else None
-            ),
+            request_args=None,
             response_id=response.get("id"),  # use vLLM ID if available
             text=text,
             input_metrics=input_metrics,
             output_metrics=output_metrics,
         )
 
-    def add_streaming_line(self, line: str) -> int | None:
+    def add_streaming_line(self, line: str | bytes) -> int | None:
         """
         Process a single line from a chat completion streaming response.
 
@@ -359,9 +383,7 @@ class ChatCompletionsResponseHandler(TextCompletionsResponseHandler):
 
         return GenerationResponse(
             request_id=request.request_id,
-            request_args=str(
-                request.arguments.model_dump() if request.arguments else None
-            ),
+            request_args=None,
             response_id=self.streaming_response_id,  # use vLLM ID if available
             text=text,
             input_metrics=input_metrics,
@@ -398,6 +420,15 @@ class AudioResponseHandler:
         self.streaming_usage: dict[str, int | dict[str, int]] | None = None
         self.streaming_response_id: str | None = None
 
+    def reset(self):
+        """
+        Clear accumulated streaming state so the handler can serve a new request.
+        """
+        self.streaming_buffer.clear()
+        self.streaming_texts.clear()
+        self.streaming_usage = None
+        self.streaming_response_id = None
+
     def compile_non_streaming(
         self, request: GenerationRequest, response: dict
     ) -> GenerationResponse:
@@ -417,29 +448,30 @@ class AudioResponseHandler:
 
         return GenerationResponse(
             request_id=request.request_id,
-            request_args=str(
-                request.arguments.model_dump() if request.arguments else None
-            ),
+            request_args=None,
             response_id=response.get("id"),  # use vLLM ID if available
             text=text,
             input_metrics=input_metrics,
             output_metrics=output_metrics,
         )
 
-    def add_streaming_line(self, line: str) -> int | None:
+    def add_streaming_line(self, line: str | bytes) -> int | None:
         """
         Process a single line from an audio streaming response.
 
         Handles JSON-formatted streaming responses from audio processing endpoints,
         extracting text content and usage metrics as they become available.
 
-        :param line: Raw JSON line from the streaming response
+        :param line: Raw JSON line from the streaming response, as bytes or str
         :return: 1 if text content was extracted, 0 if line ignored, None if done
         """
-        if line == "data: [DONE]":
+        if isinstance(line, str):
+            line = line.encode("utf-8")
+
+        if line == _END_OF_STREAM_LINE:
             return None
 
-        if not line or not (line := line.strip()) or not line.startswith("{"):
+        if not line.startswith(b"{") and not (line := line.strip()).startswith(b"{"):
             return 0
 
         data: dict[str, Any] = json.loads(line)
@@ -469,9 +501,7 @@ class AudioResponseHandler:
 
         return GenerationResponse(
             request_id=request.request_id,
-            request_args=str(
-                request.arguments.model_dump() if request.arguments else None
-            ),
+            request_args=None,
             response_id=self.streaming_response_id,
             text=text,
             input_metrics=input_metrics,
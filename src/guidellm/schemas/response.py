@@ -46,7 +46,10 @@ class GenerationResponse(StandardBaseModel):
         description="Unique identifier matching the original vLLM Response ID.",
     )
     request_args: str | None = Field(
-        description="Arguments passed to the backend for request processing."
+        description=(
+            "Arguments passed to the backend for request processing, if recorded. "
+            "compile_stats derives them from the originating request instead."
+        )
     )
     text: str | None = Field(
         default=None,
@@ -0,0 +1,6 @@
+version = "0.5.0.dev0"
+build_type = "dev"
+build_iteration = "0"
+git_commit = "55a8517c26e0b3d50ea0b8178e956e12173e451f"
+git_branch = "master"
+git_last_tag = "None"
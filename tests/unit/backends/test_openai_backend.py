@@ -5,7 +5,7 @@ Unit tests for OpenAIHTTPBackend implementation.
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
 import pytest
@@ -18,6 +18,7 @@ from guidellm.schemas import (
     RequestInfo,
     RequestTimings,
 )
+from guidellm.utils import json
 from tests.unit.testing_utils import async_timeout
 
 
@@ -131,6 +132,9 @@ class TestOpenAIHTTPBackend:
         assert backend.http2 is True
         assert backend.follow_redirects is True
         assert backend.verify is False
+        assert backend.max_connections is None
+        assert backend.max_keepalive_connections is None
+        assert backend.keepalive_expiry == 5.0
         assert backend._in_process is False
         assert backend._async_client is None
         assert backend.processes_limit is None
@@ -218,6 +222,23 @@ class TestOpenAIHTTPBackend:
         backend3 = OpenAIHTTPBackend(target="http://localhost:8000/v1/")
         assert backend3.target == "http://localhost:8000"
 
+    @pytest.mark.sanity
+    def test_request_urls(self):
+        """Test generation request URLs are resolved from the API routes."""
+        backend = OpenAIHTTPBackend(
+            target="http://localhost:8000/v1",
+            api_routes={
+                "health": "health",
+                "models": "v1/models",
+                "text_completions": "custom/completions",
+            },
+        )
+
+        assert backend._url_by_type == {
+            "text_completions": "http://localhost:8000/custom/completions"
+        }
+        assert backend._supported_types == ("text_completions",)
+
     @pytest.mark.smoke
     @pytest.mark.asyncio
     @async_timeout(10.0)
@@ -232,6 +253,8 @@ class TestOpenAIHTTPBackend:
         assert info["target"] == "http://test"
         assert info["model"] == "test-model"
         assert info["timeout"] == 30.0
+        assert info["handler_pool_size"] == 256
+        assert info["stream_chunk_size"] is None
         assert info["openai_paths"]["health"] == "health"
         assert info["openai_paths"]["models"] == "v1/models"
         assert info["openai_paths"]["text_completions"] == "v1/completions"
@@ -253,6 +276,33 @@ class TestOpenAIHTTPBackend:
         assert backend._async_client is not None
         assert isinstance(backend._async_client, httpx.AsyncClient)
 
+    @pytest.mark.sanity
+    @pytest.mark.asyncio
+    @async_timeout(10.0)
+    async def test_process_startup_connection_limits(self):
+        """Test process startup applies the configured connection pool limits."""
+        backend = OpenAIHTTPBackend(
+            target="http://test",
+            max_connections=16,
+            max_keepalive_connections=8,
+            keepalive_expiry=30.0,
+        )
+
+        with patch("guidellm.backends.openai.httpx.AsyncClient") as mock_client:
+            mock_client.return_value.aclose = AsyncMock()
+            await backend.process_startup()
+
+        limits = mock_client.call_args.kwargs["limits"]
+        assert limits.max_connections == 16
+        assert limits.max_keepalive_connections == 8
+        assert limits.keepalive_expiry == 30.0
+        assert backend.info["max_connections"] == 16
+        assert backend.info["max_keepalive_connections"] == 8
+        assert backend.info["keepalive_expiry"] == 30.0
+
+        await backend.process_shutdown()
+        mock_client.return_value.aclose.assert_awaited_once()
+
     @pytest.mark.smoke
     @pytest.mark.asyncio
     @async_timeout(10.0)
@@ -280,6 +330,97 @@ class TestOpenAIHTTPBackend:
         assert not backend._in_process
         assert backend._async_client is None
 
+    @pytest.mark.sanity
+    @pytest.mark.asyncio
+    @async_timeout(10.0)
+    async def test_process_shared_client(self):
+        """Test backends with the same client config share one HTTP client."""
+        import guidellm.backends.openai as openai_module
+
+        backend1 = OpenAIHTTPBackend(target="http://test1", timeout=15.0)
+        backend2 = OpenAIHTTPBackend(target="http://test2", timeout=15.0)
+        backend3 = OpenAIHTTPBackend(target="http://test1", timeout=25.0)
+        await backend1.process_startup()
+        await backend2.process_startup()
+        await backend3.process_startup()
+
+        assert backend1._async_client is backend2._async_client
+        assert backend1._async_client is not backend3._async_client
+
+        shared_client = backend1._async_client
+        await backend1.process_shutdown()
+        assert not shared_client.is_closed
+        assert backend2._async_client is shared_client
+
+        await backend2.process_shutdown()
+        await backend3.process_shutdown()
+        assert shared_client.is_closed
+        assert asyncio.get_running_loop() not in openai_module._SHARED_CLIENTS
+
+    @pytest.mark.regression
+    @pytest.mark.timeout(10)
+    def test_process_startup_prunes_closed_loops(self):
+        """Test clients left on a closed loop are released by the next startup."""
+        import gc
+        import weakref
+
+        import guidellm.backends.openai as openai_module
+
+        async def _handle(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+            await writer.drain()
+
+        async def _start_and_request() -> weakref.ref:
+            server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            backend = OpenAIHTTPBackend(target=f"http://127.0.0.1:{port}")
+            await backend.process_startup()
+            response = await backend._async_client.get(f"{backend.target}/health")
+            assert response.status_code == 200
+            server.close()
+            # Backend is never shut down, leaving its used client registered
+            return weakref.ref(asyncio.get_running_loop())
+
+        closed_loop = asyncio.run(_start_and_request())
+        gc.collect()
+        assert closed_loop() in openai_module._SHARED_CLIENTS
+
+        async def _startup_and_shutdown():
+            backend = OpenAIHTTPBackend(target="http://test")
+            await backend.process_startup()
+            await backend.process_shutdown()
+
+        asyncio.run(_startup_and_shutdown())
+        gc.collect()
+        assert closed_loop() is None
+
+    @pytest.mark.sanity
+    @pytest.mark.asyncio
+    @async_timeout(10.0)
+    async def test_process_startup_uvloop_warning(self):
+        """Test a default event loop is warned about once per process."""
+        import guidellm.backends.openai as openai_module
+
+        class MockUvloop:
+            class Loop:
+                pass
+
+        backend1 = OpenAIHTTPBackend(target="http://test")
+        backend2 = OpenAIHTTPBackend(target="http://test")
+
+        with (
+            patch.object(openai_module, "uvloop", MockUvloop),
+            patch.object(openai_module, "_UVLOOP_WARNED", False),
+            patch.object(openai_module, "logger") as mock_logger,
+        ):
+            await backend1.process_startup()
+            await backend2.process_startup()
+
+        mock_logger.warning.assert_called_once()
+        await backend1.process_shutdown()
+        await backend2.process_shutdown()
+
     @pytest.mark.smoke
     @pytest.mark.asyncio
     @async_timeout(10.0)
@@ -522,9 +663,7 @@ class TestOpenAIHTTPBackend:
             patch.object(backend._async_client, "request") as mock_request,
         ):
             mock_http_response = Mock()
-            mock_http_response.json.return_value = {
-                "choices": [{"text": "Hello world"}]
-            }
+            mock_http_response.content = b'{"choices": [{"text": "Hello world"}]}'
             mock_http_response.raise_for_status = Mock()
             mock_request.return_value = mock_http_response
 
@@ -535,6 +674,13 @@ class TestOpenAIHTTPBackend:
         assert len(responses) == 1
         final_response = responses[0][0]
         assert final_response.request_id == "test-id"
+        call_kwargs = mock_request.call_args[1]
+        assert json.loads(call_kwargs["content"]) == {
+            "prompt": "test prompt",
+            "temperature": 0.7,
+            "max_tokens": 100,
+        }
+        assert call_kwargs["headers"] == {"content-type": "application/json"}
 
     @pytest.mark.regression
     @pytest.mark.asyncio
@@ -581,9 +727,9 @@ class TestOpenAIHTTPBackend:
             patch.object(backend._async_client, "request") as mock_request,
         ):
             mock_http_response = Mock()
-            mock_http_response.json.return_value = {
-                "choices": [{"message": {"content": "Response"}}]
-            }
+            mock_http_response.content = (
+                b'{"choices": [{"message": {"content": "Response"}}]}'
+            )
             mock_http_response.raise_for_status = Mock()
             mock_request.return_value = mock_http_response
 
@@ -638,7 +784,7 @@ class TestOpenAIHTTPBackend:
             patch.object(backend._async_client, "request") as mock_request,
         ):
             mock_http_response = Mock()
-            mock_http_response.json.return_value = {"text": "transcribed text"}
+            mock_http_response.content = b'{"text": "transcribed text"}'
             mock_http_response.raise_for_status = Mock()
             mock_request.return_value = mock_http_response
 
@@ -651,7 +797,7 @@ class TestOpenAIHTTPBackend:
         call_kwargs = mock_request.call_args[1]
         assert call_kwargs["files"] is not None
         assert call_kwargs["data"] is not None
-        assert call_kwargs["json"] is None
+        assert call_kwargs["content"] is None
 
     @pytest.mark.regression
     @pytest.mark.asyncio
@@ -701,8 +847,8 @@ class TestOpenAIHTTPBackend:
             def raise_for_status(self):
                 pass
 
-            async def aiter_lines(self):
-                yield "data: chunk1"
+            async def aiter_bytes(self, chunk_size=None):
+                yield b"data: chunk1\n"
                 raise asyncio.CancelledError
 
         mock_stream = MockStream()
@@ -716,3 +862,338 @@ class TestOpenAIHTTPBackend:
         ):
             async for _response, _info in backend.resolve(request, request_info):
                 pass
+
+        assert request_info.timings.request_end is not None
+        assert request_info.timings.request_iterations == 1
+        assert request_info.timings.token_iterations == 1
+        assert (
+            request_info.timings.last_token_iteration
+            == request_info.timings.first_token_iteration
+        )
+
+    @pytest.mark.sanity
+    @pytest.mark.asyncio
+    @async_timeout(10.0)
+    async def test_resolve_streaming_http_error(self):
+        """Test resolve method records request_end when the stream errors."""
+        backend = OpenAIHTTPBackend(target="http://test")
+        await backend.process_startup()
+
+        request = GenerationRequest(
+            request_type="text_completions",
+            arguments=GenerationRequestArguments(
+                body={"prompt": "test"},
+                stream=True,
+            ),
+        )
+        request_info = RequestInfo(
+            request_id="test-id",
+            status="pending",
+            scheduler_node_id=1,
+            scheduler_process_id=1,
+            scheduler_start_time=123.0,
+            request_timings=RequestTimings(),
+        )
+
+        class MockStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+            def raise_for_status(self):
+                raise httpx.HTTPStatusError(
+                    "error", request=Mock(), response=Mock(status_code=500)
+                )
+
+        with (
+            patch.object(backend._async_client, "stream", return_value=MockStream()),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            async for _response, _info in backend.resolve(request, request_info):
+                pass
+
+        assert request_info.timings.request_start is not None
+        assert request_info.timings.request_end is not None
+        assert request_info.timings.request_end >= request_info.timings.request_start
+
+    @pytest.mark.regression
+    @pytest.mark.asyncio
+    @async_timeout(10.0)
+    async def test_resolve_streaming_split_lines(self):
+        """Test resolve method reassembles lines split across stream chunks."""
+        backend = OpenAIHTTPBackend(target="http://test", stream_chunk_size=4096)
+        await backend.process_startup()
+
+        request = GenerationRequest(
+            request_type="text_completions",
+            arguments=GenerationRequestArguments(
+                body={"prompt": "test"},
+                stream=True,
+            ),
+        )
+        request_info = RequestInfo(
+            request_id="test-id",
+            status="pending",
+            scheduler_node_id=1,
+            scheduler_process_id=1,
+            scheduler_start_time=123.0,
+            request_timings=RequestTimings(),
+        )
+
+        chunk_sizes = []
+
+        class MockStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+            def raise_for_status(self):
+                pass
+
+            async def aiter_bytes(self, chunk_size=None):
+                chunk_sizes.append(chunk_size)
+                yield b'data: {"choices": [{"text": "Hel"}]}\r\n\r\ndata: {"cho'
+                yield b'ices": [{"text": "lo"}]}\n\n'
+                yield b"data: [DONE]"
+
+        with patch.object(backend._async_client, "stream", return_value=MockStream()):
+            responses = [
+                response
+                async for response, _info in backend.resolve(request, request_info)
+            ]
+
+        assert len(responses) == 1
+        assert responses[0].text == "Hello"
+        assert request_info.timings.request_iterations == 5
+        assert request_info.timings.token_iterations == 2
+        assert chunk_sizes == [4096]
+
+    @pytest.mark.sanity
+    @pytest.mark.asyncio
+    @async_timeout(10.0)
+    async def test_resolve_streaming_cr_lines(self):
+        """Test resolve method splits lines terminated by a lone CR."""
+        backend = OpenAIHTTPBackend(target="http://test")
+        await backend.process_startup()
+
+        request = GenerationRequest(
+            request_type="text_completions",
+            arguments=GenerationRequestArguments(
+                body={"prompt": "test"},
+                stream=True,
+            ),
+        )
+        request_info = RequestInfo(
+            request_id="test-id",
+            status="pending",
+            scheduler_node_id=1,
+            scheduler_process_id=1,
+            scheduler_start_time=123.0,
+            request_timings=RequestTimings(),
+        )
+
+        class MockStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+            def raise_for_status(self):
+                pass
+
+            async def aiter_bytes(self, chunk_size=None):
+                yield b'data: {"choices": [{"text": "Hel"}]}\rdata: {"cho'
+                # CRLF split across chunks must not produce an extra empty line
+                yield b'ices": [{"text": "lo"}]}\r'
+                yield b"\ndata: [DONE]\r"
+
+        with patch.object(backend._async_client, "stream", return_value=MockStream()):
+            responses = [
+                response
+                async for response, _info in backend.resolve(request, request_info)
+            ]
+
+        assert len(responses) == 1
+        assert responses[0].text == "Hello"
+        assert request_info.timings.request_iterations == 3
+        assert request_info.timings.token_iterations == 2
+
+    @pytest.mark.sanity
+    @pytest.mark.asyncio
+    @async_timeout(10.0)
+    async def test_resolve_reuses_response_handlers(self):
+        """Test resolve returns response handlers to the pool for reuse."""
+        backend = OpenAIHTTPBackend(target="http://test", handler_pool_size=1)
+        await backend.process_startup()
+
+        request = GenerationRequest(
+            request_type="text_completions",
+            arguments=GenerationRequestArguments(body={"prompt": "test"}),
+        )
+
+        def _request_info() -> RequestInfo:
+            return RequestInfo(
+                request_id="test-id",
+                status="pending",
+                scheduler_node_id=1,
+                scheduler_process_id=1,
+                scheduler_start_time=123.0,
+                request_timings=RequestTimings(),
+            )
+
+        mock_http_response = Mock()
+        mock_http_response.content = b'{"choices": [{"text": "Hello"}]}'
+        mock_http_response.raise_for_status = Mock()
+
+        with patch.object(
+            backend._async_client, "request", return_value=mock_http_response
+        ):
+            async for _ in backend.resolve(request, _request_info()):
+                pass
+            pooled = backend._handler_pool["text_completions"]
+            assert len(pooled) == 1
+            handler = pooled[0]
+
+            async for response, _info in backend.resolve(request, _request_info()):
+                assert response.text == "Hello"
+            assert backend._handler_pool["text_completions"] == [handler]
+
+        await backend.process_shutdown()
+        assert backend._handler_pool == {}
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize("base", ["protocol", "builtin"])
+    @pytest.mark.asyncio
+    @async_timeout(10.0)
+    async def test_resolve_does_not_reuse_override_handlers(self, base):
+        """Test stateful response handler overrides are never pooled."""
+        from guidellm.backends.response_handlers import (
+            GenerationResponseHandler,
+            TextCompletionsResponseHandler,
+        )
+
+        base_class = (
+            GenerationResponseHandler
+            if base == "protocol"
+            else TextCompletionsResponseHandler
+        )
+
+        class AccumulatingHandler(base_class):
+            def __init__(self):
+                super().__init__()
+                # State an inherited reset does not know about
+                self.texts: list[str] = []
+
+            def add_streaming_line(self, line: str | bytes) -> int | None:
+                self.texts.append("A")
+                return 1
+
+            def compile_streaming(self, request):
+                return GenerationResponse(
+                    request_id=request.request_id,
+                    request_args=None,
+                    text="".join(self.texts),
+                )
+
+        backend = OpenAIHTTPBackend(
+            target="http://test",
+            response_handlers={"text_completions": AccumulatingHandler},
+        )
+        await backend.process_startup()
+
+        request = GenerationRequest(
+            request_type="text_completions",
+            arguments=GenerationRequestArguments(
+                body={"prompt": "test"},
+                stream=True,
+            ),
+        )
+
+        class MockStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+            def raise_for_status(self):
+                pass
+
+            async def aiter_bytes(self, chunk_size=None):
+                yield b"data: chunk\n"
+
+        async def _resolve_text() -> str:
+            request_info = RequestInfo(
+                request_id="test-id",
+                status="pending",
+                scheduler_node_id=1,
+                scheduler_process_id=1,
+                scheduler_start_time=123.0,
+                request_timings=RequestTimings(),
+            )
+            with patch.object(
+                backend._async_client, "stream", return_value=MockStream()
+            ):
+                return [
+                    response.text
+                    async for response, _info in backend.resolve(request, request_info)
+                ][-1]
+
+        assert [await _resolve_text() for _ in range(3)] == ["A", "A", "A"]
+        assert "text_completions" not in backend._handler_pool
+        await backend.process_shutdown()
+
+    @pytest.mark.sanity
+    @pytest.mark.asyncio
+    @async_timeout(10.0)
+    async def test_resolve_streaming_chunk_arrival_timings(self):
+        """Test lines received in the same chunk share the chunk arrival time."""
+        backend = OpenAIHTTPBackend(target="http://test")
+        await backend.process_startup()
+
+        request = GenerationRequest(
+            request_type="text_completions",
+            arguments=GenerationRequestArguments(
+                body={"prompt": "test"},
+                stream=True,
+            ),
+        )
+        request_info = RequestInfo(
+            request_id="test-id",
+            status="pending",
+            scheduler_node_id=1,
+            scheduler_process_id=1,
+            scheduler_start_time=123.0,
+            request_timings=RequestTimings(),
+        )
+
+        class MockStream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                pass
+
+            def raise_for_status(self):
+                pass
+
+            async def aiter_bytes(self, chunk_size=None):
+                yield (
+                    b'data: {"choices": [{"text": "Hel"}]}\n\n'
+                    b'data: {"choices": [{"text": "lo"}]}\n\n'
+                    b"data: [DONE]\n\n"
+                )
+
+        with patch.object(backend._async_client, "stream", return_value=MockStream()):
+            async for response, _info in backend.resolve(request, request_info):
+                assert response.text == "Hello"
+
+        timings = request_info.timings
+        assert timings.token_iterations == 2
+        assert timings.first_token_iteration == timings.last_token_iteration
+        assert timings.first_request_iteration == timings.last_request_iteration
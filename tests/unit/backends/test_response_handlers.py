@@ -35,6 +35,7 @@ class TestGenerationResponseHandler:
         assert hasattr(GenerationResponseHandler, "compile_non_streaming")
         assert hasattr(GenerationResponseHandler, "add_streaming_line")
         assert hasattr(GenerationResponseHandler, "compile_streaming")
+        assert not hasattr(GenerationResponseHandler, "reset")
 
 
 class TestGenerationResponseHandlerFactory:
@@ -116,6 +117,22 @@ class TestTextCompletionsResponseHandler:
         assert instance.streaming_texts == []
         assert instance.streaming_usage is None
 
+    @pytest.mark.sanity
+    def test_reset(self, valid_instances, generation_request):
+        """Test reset clears accumulated streaming state."""
+        instance: TextCompletionsResponseHandler = valid_instances
+        instance.add_streaming_line(
+            'data: {"id": "cmpl-1", "choices": [{"text": "Hi"}], '
+            '"usage": {"prompt_tokens": 1, "completion_tokens": 1}}'
+        )
+
+        instance.reset()
+
+        assert instance.streaming_texts == []
+        assert instance.streaming_usage is None
+        assert instance.streaming_response_id is None
+        assert instance.compile_streaming(generation_request).text == ""
+
     @pytest.mark.smoke
     @pytest.mark.parametrize(
         (
@@ -168,6 +185,7 @@ class TestTextCompletionsResponseHandler:
         result = instance.compile_non_streaming(generation_request, response)
 
         assert result.text == expected_text
+        assert result.request_args is None
         assert result.input_metrics.text_tokens == expected_input_tokens
         assert result.output_metrics.text_tokens == expected_output_tokens
         assert result.output_metrics.text_words == len(expected_text.split())
@@ -246,6 +264,14 @@ class TestTextCompletionsResponseHandler:
             ("", {}),
             ("invalid line", {}),
             ('data: {"test": "value"}', {"test": "value"}),
+            (b'data: {"choices": [{"text": "Test"}]}', {"choices": [{"text": "Test"}]}),
+            (b"data: [DONE]", None),
+            (b"", {}),
+            (b"invalid line", {}),
+            (b'  data: {"test": "value"}  ', {"test": "value"}),
+            (b"  data: [DONE]\r", None),
+            (b"data: [DONE] ", None),
+            ("data: [DONE]\t", None),
         ],
     )
     def test_extract_line_data(self, valid_instances, line, expected_output):
@@ -521,6 +547,20 @@ class TestAudioResponseHandler:
         assert instance.streaming_texts == []
         assert instance.streaming_usage is None
 
+    @pytest.mark.sanity
+    def test_reset(self, valid_instances):
+        """Test reset clears accumulated streaming state."""
+        instance: AudioResponseHandler = valid_instances
+        instance.streaming_buffer.extend(b"audio")
+        instance.add_streaming_line('{"id": "audio-1", "text": "Hi", "usage": {}}')
+
+        instance.reset()
+
+        assert len(instance.streaming_buffer) == 0
+        assert instance.streaming_texts == []
+        assert instance.streaming_usage is None
+        assert instance.streaming_response_id is None
+
     @pytest.mark.smoke
     @pytest.mark.parametrize(
         (